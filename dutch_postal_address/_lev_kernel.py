@@ -0,0 +1,48 @@
+"""Numba kernel for fuzzy street lookups; needs the optional numba dependency."""
+import numpy as np
+from numba import njit, prange
+
+_LEV_BLOCK = 1024
+
+
+@njit(parallel=True, cache=True)
+def batch_lev(q: np.ndarray, db: np.ndarray, db_lens: np.ndarray,
+              out: np.ndarray, max_distance: int):
+    """
+    Levenshtein distance from q to every padded row of db (Wagner-Fischer).
+
+    Rows whose length alone puts them beyond max_distance, or whose DP row
+    minimum exceeds it, get max_distance + 1 instead of the exact distance.
+    """
+    m = q.shape[0]
+    n_rows = db.shape[0]
+    for block in prange((n_rows + _LEV_BLOCK - 1) // _LEV_BLOCK):
+        prev = np.empty(m + 1, dtype=np.int32)
+        cur = np.empty(m + 1, dtype=np.int32)
+        for i in range(block * _LEV_BLOCK, min(n_rows, (block + 1) * _LEV_BLOCK)):
+            n = db_lens[i]
+            if abs(n - m) > max_distance:
+                out[i] = max_distance + 1
+                continue
+            for k in range(m + 1):
+                prev[k] = k
+            distance = m
+            for j in range(1, n + 1):
+                c = db[i, j - 1]
+                cur[0] = j
+                row_min = j
+                for k in range(1, m + 1):
+                    best = prev[k - 1] + (q[k - 1] != c)
+                    if prev[k] + 1 < best:
+                        best = prev[k] + 1
+                    if cur[k - 1] + 1 < best:
+                        best = cur[k - 1] + 1
+                    cur[k] = best
+                    if best < row_min:
+                        row_min = best
+                prev, cur = cur, prev
+                distance = prev[m]
+                if row_min > max_distance:
+                    distance = max_distance + 1
+                    break
+            out[i] = min(distance, max_distance + 1)
@@ -2,8 +2,10 @@ import re
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+_MULTISPACE_RE = re.compile(r'\s{2,}')
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Address:
     """
     Immutable data class representing a Dutch postal address.
@@ -36,15 +38,24 @@ class Address:
 
         return f"{postcode[:4]} {postcode[4:]}"
 
+    @staticmethod
+    def _is_valid_postcode(postcode: str) -> bool:
+        """Check postcode against '^\\d{4}\\s?[A-Z]{2}$', ignoring case."""
+        if len(postcode) == 7 and postcode[4].isspace():
+            postcode = postcode[:4] + postcode[5:]
+        postcode = postcode.upper()
+        return (len(postcode) == 6 and postcode.isascii()
+                and postcode[:4].isdigit() and postcode[4:].isalpha())
+
     @property
     def pc4(self) -> str:
         """First 4 digits of postcode."""
-        return self.postcode[:4].strip() if self.postcode and len(self.postcode) >= 4 else ''
+        return self.postcode[:4].strip() if len(self.postcode) >= 4 else ''
 
     @property
     def pc6(self) -> str:
         """Full postcode without space."""
-        return self.postcode.replace(' ', '') if self.postcode else ''
+        return self.postcode.replace(' ', '')
 
     def to_lines(self) -> List[str]:
         """Convert to standard two-line format."""
@@ -73,18 +84,26 @@ class Address:
         line1 = address_lines[0].strip()
         line2 = address_lines[1].strip()
 
-        # Parse street line
-        street_match = re.match(r'^(.+?)\s+(\d+)([A-Za-z]*?)$', line1)
-        if not street_match:
+        # Parse street line right to left: '<street> <number><letters>'
+        i = len(line1)
+        while i and line1[i - 1].isascii() and line1[i - 1].isalpha():
+            i -= 1
+        ext_start = i
+
+        while i and line1[i - 1].isdecimal():
+            i -= 1
+        num_start = i
+
+        street_name = line1[:num_start].rstrip()
+        if num_start == ext_start or not street_name or not line1[num_start - 1].isspace():
             raise ValueError(f"Cannot parse street address: {line1}")
 
-        street_name = street_match.group(1).strip()
-        house_number = int(street_match.group(2))
-        house_extension = street_match.group(3).upper()
+        house_number = int(line1[num_start:ext_start])
+        house_extension = line1[ext_start:].upper()
 
         # Parse city line
         # Remove multiple spaces and split
-        line2 = re.sub(r'\s{2,}', '  ', line2)
+        line2 = _MULTISPACE_RE.sub('  ', line2)
         parts = line2.split('  ')
 
         if len(parts) >= 2:
@@ -99,6 +118,9 @@ class Address:
             else:
                 raise ValueError(f"Cannot parse city line: {line2}")
 
+        if not cls._is_valid_postcode(postcode):
+            raise ValueError(f"Invalid postcode: {postcode}")
+
         return cls(
             street_name=street_name,
             house_number=house_number,
@@ -113,7 +135,7 @@ class DutchAddressHandler:
     Main handler for Dutch postal address operations.
     """
 
-    def __init__(self, data_dir: str = 'data'):
+    def __init__(self, data_dir: Optional[str] = None):
         from .data_loader import DataLoader
         from .validator import AddressValidator
         from .corrector import AddressCorrector
@@ -146,13 +168,19 @@ class DutchAddressHandler:
         address = self.parse_address(address_lines)
         return self.validator.validate(address) if address else False
 
-    def correct_city(self, city: str, postcode: Optional[str] = None) -> List[str]:
+    def correct_city(self, city: str, postcode: Optional[str] = None,
+                     limit: int = 20) -> List[str]:
         """Correct city name."""
-        return self.corrector.correct_city(city, postcode)
+        return self.corrector.correct_city(city, postcode, limit)
+
+    def correct_many_cities(self, cities: List[str], limit: int = 20) -> List[List[str]]:
+        """Correct several city names at once."""
+        return self.corrector.correct_many_cities(cities, limit)
 
-    def correct_street(self, street: str, postcode: Optional[str] = None) -> List[str]:
+    def correct_street(self, street: str, postcode: Optional[str] = None,
+                       limit: int = 20) -> List[str]:
         """Correct street name."""
-        return self.corrector.correct_street(street, postcode)
+        return self.corrector.correct_street(street, postcode, limit)
 
     def search_addresses(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search addresses by partial input."""
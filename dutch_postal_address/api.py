@@ -1,18 +1,29 @@
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 import uvicorn
 
-from .address import DutchAddressHandler
-from .validator import validate, validate_lines as validate_lines_func
-from .corrector import correct_city as correct_city_func, correct_street as correct_street_func
+from .validator import _get_handler
+
+try:
+    import orjson  # optional, installed with the "full" extra
+except ImportError:
+    orjson = None
+
+# FastAPI releases that serialize response models straight to JSON bytes
+# deprecate ORJSONResponse and warn on every request; use it only before that
+_RESPONSE_CLASS = ({'default_response_class': ORJSONResponse}
+                   if orjson is not None and not hasattr(ORJSONResponse, '__deprecated__')
+                   else {})
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Dutch Postal Address API",
     description="API for validating and correcting Dutch postal addresses",
-    version="1.0.0"
+    version="1.0.0",
+    **_RESPONSE_CLASS
 )
 
 # Add CORS middleware
@@ -24,12 +35,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize handler
-handler = DutchAddressHandler()
+# Initialize handler (shared with the module-level convenience functions)
+handler = _get_handler()
 
 
 # Pydantic models for request/response
-class AddressRequest(BaseModel):
+class _ApiModel(BaseModel):
+    """Shared config: ignore unknown fields, skip validation on assignment."""
+    model_config = ConfigDict(extra='ignore', validate_assignment=False)
+
+
+class AddressRequest(_ApiModel):
     street_name: str
     house_number: int
     house_number_extension: str = ""
@@ -37,22 +53,31 @@ class AddressRequest(BaseModel):
     city: str
 
 
-class AddressLinesRequest(BaseModel):
+class AddressLinesRequest(_ApiModel):
     lines: List[str]
 
 
-class ValidationResponse(BaseModel):
+class CityBatchRequest(_ApiModel):
+    cities: List[str] = Field(..., max_length=100)
+
+
+class ValidationResponse(_ApiModel):
     valid: bool
     normalized_address: Optional[dict] = None
 
 
-class CorrectionResponse(BaseModel):
+class CorrectionResponse(_ApiModel):
     input: str
     suggestions: List[str]
     count: int
 
 
-class SearchResponse(BaseModel):
+class BatchCorrectionResponse(_ApiModel):
+    results: List[CorrectionResponse]
+    count: int
+
+
+class SearchResponse(_ApiModel):
     query: str
     results: List[dict]
     count: int
@@ -69,6 +94,7 @@ async def root():
             "/validate": "POST - Validate complete address",
             "/validate/lines": "POST - Validate address from lines",
             "/correct/city": "GET - Correct city name",
+            "/correct/city/batch": "POST - Correct multiple city names",
             "/correct/street": "GET - Correct street name",
             "/search": "GET - Search addresses"
         }
@@ -79,7 +105,7 @@ async def root():
 async def validate_address(request: AddressRequest):
     """Validate a complete address."""
     try:
-        is_valid = validate(
+        is_valid, normalized = handler.validator.validate_components(
             street_name=request.street_name,
             house_number=request.house_number,
             house_number_extension=request.house_number_extension,
@@ -87,20 +113,7 @@ async def validate_address(request: AddressRequest):
             city=request.city
         )
 
-        response = {"valid": is_valid}
-
-        if is_valid:
-            from .address import Address
-            address = Address(
-                street_name=request.street_name,
-                house_number=request.house_number,
-                house_number_extension=request.house_number_extension,
-                postcode=request.postcode,
-                city=request.city
-            )
-            response["normalized_address"] = address.to_dict()
-
-        return response
+        return {"valid": is_valid, "normalized_address": normalized}
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -110,7 +123,7 @@ async def validate_address(request: AddressRequest):
 async def validate_address_lines(request: AddressLinesRequest):
     """Validate address from two-line format."""
     try:
-        is_valid = validate_lines_func(request.lines)
+        is_valid = handler.validate_lines(request.lines)
 
         response = {"valid": is_valid}
 
@@ -131,11 +144,12 @@ async def validate_address_lines(request: AddressLinesRequest):
 @app.get("/correct/city", response_model=CorrectionResponse)
 async def correct_city_endpoint(
         city: str = Query(..., description="City name to correct"),
-        postcode: Optional[str] = Query(None, description="Optional postcode filter (PC4 or PC6)")
+        postcode: Optional[str] = Query(None, description="Optional postcode filter (PC4 or PC6)"),
+        limit: int = Query(20, description="Maximum suggestions", ge=1, le=100)
 ):
     """Correct a city name."""
     try:
-        suggestions = correct_city_func(city, postcode)
+        suggestions = handler.correct_city(city, postcode, limit)
         return {
             "input": city,
             "suggestions": suggestions,
@@ -145,14 +159,35 @@ async def correct_city_endpoint(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.post("/correct/city/batch", response_model=BatchCorrectionResponse)
+async def correct_city_batch_endpoint(
+        request: CityBatchRequest,
+        limit: int = Query(20, description="Maximum suggestions per city", ge=1, le=100)
+):
+    """Correct multiple city names."""
+    try:
+        suggestions = handler.correct_many_cities(request.cities, limit)
+        results = [
+            {"input": city, "suggestions": city_suggestions, "count": len(city_suggestions)}
+            for city, city_suggestions in zip(request.cities, suggestions)
+        ]
+        return {
+            "results": results,
+            "count": len(results)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/correct/street", response_model=CorrectionResponse)
 async def correct_street_endpoint(
         street: str = Query(..., description="Street name to correct"),
-        postcode: Optional[str] = Query(None, description="Optional postcode filter (PC4 or PC6)")
+        postcode: Optional[str] = Query(None, description="Optional postcode filter (PC4 or PC6)"),
+        limit: int = Query(20, description="Maximum suggestions", ge=1, le=100)
 ):
     """Correct a street name."""
     try:
-        suggestions = correct_street_func(street, postcode)
+        suggestions = handler.correct_street(street, postcode, limit)
         return {
             "input": street,
             "suggestions": suggestions,
@@ -1,28 +1,52 @@
-from typing import List, Optional, Set
+from typing import TYPE_CHECKING, List, Optional, Set
+import heapq
 import re
-from difflib import get_close_matches
-from .data_loader import DataLoader
+from rapidfuzz import fuzz, process
+
+if TYPE_CHECKING:
+    from .data_loader import DataLoader
+
+_PC_RE = re.compile(r'(\d{4})\s?([A-Za-z]{2})?')
+
+# Maximum edit distance for BK-tree fuzzy lookups
+BKTREE_MAX_DISTANCE = 2
+
+# Maximum number of fuzzy suggestions
+MAX_FUZZY_MATCHES = 10
+
+# Minimum WRatio score for a fuzzy suggestion
+FUZZY_SCORE_CUTOFF = 60
+
+# Shorter queries only get exact matches; any fuzzy hit would be noise
+MIN_FUZZY_LENGTH = 3
+
+
+def _edit_distance_for(normalized: str) -> int:
+    """Edit distance allowed for a query: one per three characters, capped."""
+    return min(BKTREE_MAX_DISTANCE, len(normalized) // 3)
 
 
 class AddressCorrector:
     """Correct mistyped address components."""
 
-    def __init__(self, data_loader: DataLoader):
+    def __init__(self, data_loader: 'DataLoader'):
         self.data = data_loader
 
-    def correct_city(self, city: str, postcode: Optional[str] = None) -> List[str]:
+    def correct_city(self, city: str, postcode: Optional[str] = None,
+                     limit: int = 20) -> List[str]:
         """
         Correct a city name.
 
         Args:
             city: (Possibly mistyped) city name
             postcode: Optional PC4 or PC6 for filtering
+            limit: Maximum number of suggestions
 
         Returns:
-            List of possible correct city names
+            List of possible correct city names; exact matches sorted
+            alphabetically, fuzzy matches best first
         """
         normalized_input = self.data._normalize_name(city)
-        results = set()
 
         # Determine postcode filter
         pc4_filter = None
@@ -32,50 +56,120 @@ class AddressCorrector:
                 pc4_filter = clean_pc[:4]
 
         # Strategy 1: Exact match
-        all_city_names = []
-        for city_id, city_name in self.data._city_map.items():
-            if pc4_filter:
-                if city_id not in self.data.get_cities_by_pc4(pc4_filter):
-                    continue
+        city_ids = self.data._city_name_to_id.get(normalized_input, [])
+        if pc4_filter:
+            pc4_cities = set(self.data.get_city_ids_by_pc4(pc4_filter).tolist())
+            city_ids = set(city_ids) & pc4_cities
 
-            normalized_city = self.data._normalize_name(city_name)
-            all_city_names.append((city_name, normalized_city))
+        exact = {self.data._city_map[city_id] for city_id in city_ids}
 
-            if normalized_input == normalized_city:
-                results.add(city_name)
+        if exact:
+            return heapq.nsmallest(limit, exact)
 
-        if results:
-            return sorted(results)
+        # Strategy 2: Fuzzy matching, best match first
+        if len(normalized_input) < MIN_FUZZY_LENGTH:
+            return []
 
-        # Strategy 2: Fuzzy matching
-        city_names = [name for name, norm in all_city_names]
-        normalized_names = [norm for name, norm in all_city_names]
+        fuzzy_limit = min(limit, MAX_FUZZY_MATCHES)
+        results = {}
 
-        # Use difflib for fuzzy matching
-        matches = get_close_matches(normalized_input, normalized_names,
-                                    n=10, cutoff=0.6)
+        if pc4_filter:
+            names = {city_id: self.data._city_map[city_id]
+                     for city_id in pc4_cities if city_id in self.data._city_map}
+            choices = {city_id: self.data._normalize_name(name)
+                       for city_id, name in names.items()}
+        else:
+            # BK-tree search for close edits, full scan only if it finds nothing
+            results = dict.fromkeys(self._close_city_names(normalized_input, fuzzy_limit))
 
-        for match in matches:
-            # Find original city name
-            for orig_name, norm_name in all_city_names:
-                if norm_name == match:
-                    results.add(orig_name)
+            if results:
+                return list(results)[:limit]
 
-        return sorted(results)
+            names = self.data._all_city_names
+            choices = self.data._all_city_norms
 
-    def correct_street(self, street: str, postcode: Optional[str] = None) -> List[str]:
+        matches = process.extract(normalized_input, choices,
+                                  scorer=fuzz.WRatio, limit=fuzzy_limit,
+                                  score_cutoff=FUZZY_SCORE_CUTOFF)
+
+        results.update(dict.fromkeys(names[key] for _, _, key in matches))
+
+        return list(results)[:limit]
+
+    def _close_city_names(self, normalized: str, limit: int) -> List[str]:
+        """City names within the query's edit distance (BK-tree), closest first."""
+        results = {}
+        candidates = self.data._city_bktree.find(normalized, _edit_distance_for(normalized))
+        for _, match in candidates[:limit]:
+            results.update(dict.fromkeys(self.data._city_map[city_id]
+                                         for city_id in self.data._city_name_to_id[match]))
+        return list(results)
+
+    def correct_many_cities(self, cities: List[str], limit: int = 20) -> List[List[str]]:
+        """
+        Correct several city names in one pass.
+
+        Each input gets the same suggestions as correct_city without a
+        postcode; inputs left for the full fuzzy scan are scored together
+        with a single parallel rapidfuzz cdist.
+
+        Args:
+            cities: (Possibly mistyped) city names
+            limit: Maximum number of suggestions per city
+
+        Returns:
+            List of possible correct city names for each input, in input order
+        """
+        fuzzy_limit = min(limit, MAX_FUZZY_MATCHES)
+        results = []
+        pending = []
+
+        for normalized in map(self.data._normalize_name, cities):
+            exact = {self.data._city_map[city_id]
+                     for city_id in self.data._city_name_to_id.get(normalized, [])}
+            if exact:
+                results.append(heapq.nsmallest(limit, exact))
+            elif len(normalized) < MIN_FUZZY_LENGTH:
+                results.append([])
+            else:
+                results.append(self._close_city_names(normalized, fuzzy_limit)[:limit])
+                if not results[-1]:
+                    pending.append((len(results) - 1, normalized))
+
+        if not pending or not self.data._all_city_norms:
+            return results
+
+        import numpy as np
+
+        names = self.data._all_city_names
+        scores = process.cdist([normalized for _, normalized in pending],
+                               self.data._all_city_norms, scorer=fuzz.WRatio,
+                               score_cutoff=FUZZY_SCORE_CUTOFF,
+                               dtype=np.float64, workers=-1)
+
+        for (i, _), row in zip(pending, scores):
+            # Best score first, ties in name order, as process.extract ranks them
+            top = np.argsort(-row, kind='stable')[:fuzzy_limit]
+            top = top[row[top] >= FUZZY_SCORE_CUTOFF]
+            results[i] = list(dict.fromkeys(names[j] for j in top.tolist()))[:limit]
+
+        return results
+
+    def correct_street(self, street: str, postcode: Optional[str] = None,
+                       limit: int = 20) -> List[str]:
         """
         Correct a street name.
 
         Args:
             street: (Possibly mistyped) street name
             postcode: Optional PC4 or PC6 for filtering
+            limit: Maximum number of suggestions
 
         Returns:
-            List of possible correct street names
+            List of possible correct street names; exact matches sorted
+            alphabetically, fuzzy matches best first
         """
         normalized_input = self.data._normalize_name(street)
-        results = set()
 
         # Determine postcode filter
         pc6_filter = None
@@ -85,37 +179,50 @@ class AddressCorrector:
                 pc6_filter = clean_pc
 
         # Strategy 1: Exact match
-        all_street_names = []
-        for street_id, street_name in self.data._street_map.items():
-            if pc6_filter:
-                # Check if this street exists in the postcode area
-                entries = self.data.get_addresses_by_pc6(pc6_filter)
-                street_ids_in_pc6 = {e['street_id'] for e in entries if e.get('street_id')}
-                if street_id not in street_ids_in_pc6:
-                    continue
+        street_ids = self.data._street_name_to_id.get(normalized_input, [])
+        if pc6_filter:
+            # Only streets that exist in the postcode area
+            pc6_streets = set(self.data.get_street_ids_by_pc6(pc6_filter).tolist())
+            street_ids = set(street_ids) & pc6_streets
+
+        exact = {self.data._street_map[street_id] for street_id in street_ids}
+
+        if exact:
+            return heapq.nsmallest(limit, exact)
+
+        # Strategy 2: Fuzzy matching, best match first
+        if len(normalized_input) < MIN_FUZZY_LENGTH:
+            return []
 
-            normalized_street = self.data._normalize_name(street_name)
-            all_street_names.append((street_name, normalized_street))
+        fuzzy_limit = min(limit, MAX_FUZZY_MATCHES)
+        results = {}
 
-            if normalized_input == normalized_street:
-                results.add(street_name)
+        if pc6_filter:
+            names = {street_id: self.data._street_map[street_id]
+                     for street_id in pc6_streets if street_id in self.data._street_map}
+            choices = {street_id: self.data._normalize_name(name)
+                       for street_id, name in names.items()}
+        else:
+            # Close edits first (Numba kernel or BK-tree), full scan only if none
+            candidates = self.data.find_close_street_names(
+                normalized_input, _edit_distance_for(normalized_input), fuzzy_limit)
+            for _, match in candidates:
+                results.update(dict.fromkeys(self.data._street_map[street_id]
+                                             for street_id in self.data._street_name_to_id[match]))
 
-        if results:
-            return sorted(results)
+            if results:
+                return list(results)[:limit]
 
-        # Strategy 2: Fuzzy matching
-        street_names = [name for name, norm in all_street_names]
-        normalized_names = [norm for name, norm in all_street_names]
+            names = self.data._all_street_names
+            choices = self.data._all_street_norms
 
-        matches = get_close_matches(normalized_input, normalized_names,
-                                    n=10, cutoff=0.6)
+        matches = process.extract(normalized_input, choices,
+                                  scorer=fuzz.WRatio, limit=fuzzy_limit,
+                                  score_cutoff=FUZZY_SCORE_CUTOFF)
 
-        for match in matches:
-            for orig_name, norm_name in all_street_names:
-                if norm_name == match:
-                    results.add(orig_name)
+        results.update(dict.fromkeys(names[key] for _, _, key in matches))
 
-        return sorted(results)
+        return list(results)[:limit]
 
     def search_addresses(self, query: str, limit: int = 10) -> List[dict]:
         """
@@ -135,7 +242,7 @@ class AddressCorrector:
             return results
 
         # Check if it's a postcode
-        pc_match = re.match(r'(\d{4})\s?([A-Za-z]{2})?', query)
+        pc_match = _PC_RE.match(query)
         if pc_match:
             pc4 = pc_match.group(1)
             if pc_match.group(2):
@@ -153,8 +260,8 @@ class AddressCorrector:
                         })
             else:
                 # PC4 search
-                city_ids = self.data.get_cities_by_pc4(pc4)
-                for city_id in list(city_ids)[:5]:
+                city_ids = self.data.get_city_ids_by_pc4(pc4)
+                for city_id in city_ids[:5].tolist():
                     city = self.data.get_city_by_id(city_id)
                     if city:
                         results.append({
@@ -163,41 +270,39 @@ class AddressCorrector:
                             'type': 'city'
                         })
 
-        # City search
+        # City / street name search
         if len(results) < limit:
-            city_suggestions = self.correct_city(query)
-            for city in city_suggestions[:3]:
-                # Find postcodes for this city
-                for pc6, entries in self.data._pc6_index.items():
-                    for entry in entries:
-                        if entry.get('city_id'):
-                            city_name = self.data.get_city_by_id(entry['city_id'])
-                            if city_name == city:
-                                street = self.data.get_street_by_id(entry['street_id'])
-                                if street:
-                                    results.append({
-                                        'street': street,
-                                        'city': city,
-                                        'postcode': f"{pc6[:4]} {pc6[4:]}",
-                                        'house_number_range': f"{entry['hnr_from']}-{entry['hnr_to']}"
-                                    })
-                                    break
-                    if len(results) >= limit:
-                        break
+            entries = self.data.find_addresses_by_name_prefix(query, limit - len(results))
+
+            # Fall back to fuzzy city correction for mistyped names
+            if not entries:
+                for city in self.correct_city(query, limit=3):
+                    entries.extend(self.data.find_addresses_by_name_prefix(
+                        city, limit - len(results) - len(entries)))
+
+            for entry in entries:
+                street = self.data.get_street_by_id(entry['street_id'])
+                city = self.data.get_city_by_id(entry['city_id'])
+                if street and city:
+                    pc6 = entry['pc6']
+                    results.append({
+                        'street': street,
+                        'city': city,
+                        'postcode': f"{pc6[:4]} {pc6[4:]}",
+                        'house_number_range': f"{entry['hnr_from']}-{entry['hnr_to']}"
+                    })
 
         return results[:limit]
 
 
 # Convenience functions
-def correct_city(city: str, postcode: Optional[str] = None) -> List[str]:
+def correct_city(city: str, postcode: Optional[str] = None, limit: int = 20) -> List[str]:
     """Public function to correct city name."""
-    from .address import DutchAddressHandler
-    handler = DutchAddressHandler()
-    return handler.correct_city(city, postcode)
+    from .validator import _get_handler
+    return _get_handler().correct_city(city, postcode, limit)
 
 
-def correct_street(street: str, postcode: Optional[str] = None) -> List[str]:
+def correct_street(street: str, postcode: Optional[str] = None, limit: int = 20) -> List[str]:
     """Public function to correct street name."""
-    from .address import DutchAddressHandler
-    handler = DutchAddressHandler()
-    return handler.correct_street(street, postcode)
\ No newline at end of file
+    from .validator import _get_handler
+    return _get_handler().correct_street(street, postcode, limit)
\ No newline at end of file
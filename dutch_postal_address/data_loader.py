@@ -1,9 +1,100 @@
-import re
-from typing import Dict, List, Set, Optional, DefaultDict
+import csv
+import os
+import string
+import sys
+import tempfile
+import zipfile
+from typing import Dict, List, NamedTuple, Set, Tuple, Optional, DefaultDict, Iterator
 from collections import defaultdict
 from pathlib import Path
 import unicodedata
-from functools import lru_cache
+from bisect import bisect_left
+from functools import lru_cache, cached_property
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+import pybktree
+from rapidfuzz.distance import Levenshtein
+
+DEFAULT_DATA_DIR = os.environ.get('DATA_DIR', 'data')
+
+
+class _PunctMap(dict):
+    """
+    str.translate table mapping every non-alphanumeric, non-space character
+    to a space.
+
+    Punctuation is precomputed; any other code point is classified on first
+    sight and memoized.
+    """
+
+    def __missing__(self, code: int) -> int:
+        char = chr(code)
+        keep = char.isalnum() or char.isspace()
+        self[code] = mapped = code if keep else 0x20
+        return mapped
+
+
+_PUNCT_MAP = _PunctMap(str.maketrans({c: ' ' for c in string.punctuation + '\u2013\u2014\u00b7'}))
+
+# One packed record per PCS_HNR.dat row (structure-of-arrays layout)
+HNR_DTYPE = np.dtype([
+    ('hnr_from', 'u4'),
+    ('hnr_to', 'u4'),
+    ('street_id', 'u4'),
+    ('city_id', 'u4'),
+])
+
+# Prebuilt index cache, stored next to the .dat files
+INDEX_CACHE_FILE = '_index_cache.npz'
+INDEX_CACHE_VERSION = 3
+DATA_FILES = ('PCS_WPL.dat', 'PCS_STR.dat', 'PCS_HNR.dat')
+# Grouped indexes stored in the cache as <name>_keys/_offsets/_values
+_CACHED_CSR_INDEXES = ('pc4_index', 'street_id_to_pc6', 'city_id_to_pc6')
+
+_EMPTY_SLICE = slice(0, 0)
+_EMPTY_IDS = np.empty(0, dtype=np.uint32)
+_UINT32_MAX = np.iinfo(np.uint32).max
+
+
+class CsrIndex(NamedTuple):
+    """
+    Grouped index in CSR layout: the values stored under keys[i] are
+    values[offsets[i]:offsets[i + 1]], in ascending order.
+    """
+    keys: np.ndarray
+    offsets: np.ndarray
+    values: np.ndarray
+
+
+_EMPTY_CSR = CsrIndex(np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64), _EMPTY_IDS)
+
+
+def _group_pairs(groups: np.ndarray, values: np.ndarray) -> CsrIndex:
+    """Group the distinct (group, value) pairs of two u4-range arrays; values stay u4."""
+    pairs = np.unique((groups.astype(np.uint64) << np.uint64(32)) | values.astype(np.uint64))
+    keys, starts = np.unique((pairs >> np.uint64(32)).astype(np.int64), return_index=True)
+    return CsrIndex(keys, np.append(starts, len(pairs)),
+                    (pairs & np.uint64(_UINT32_MAX)).astype(np.uint32))
+
+
+def _csr_slice(keys: np.ndarray, offsets: np.ndarray, key) -> slice:
+    """Slice of the values stored under key; empty if key is absent."""
+    i = int(np.searchsorted(keys, key))
+    if i < len(keys) and keys[i] == key:
+        return slice(int(offsets[i]), int(offsets[i + 1]))
+    return _EMPTY_SLICE
+
+
+@lru_cache(maxsize=None)
+def _load_batch_lev():
+    """Import the Numba distance kernel on first use; None without numba."""
+    try:
+        from ._lev_kernel import batch_lev
+    except ImportError:  # optional, installed with the "full" extra
+        return None
+    return batch_lev
 
 
 class DataLoader:
@@ -11,163 +102,349 @@ class DataLoader:
     Loads and indexes Dutch postal address data.
 
     Memory Optimizations:
+    - Parses PCS_HNR.dat with the pandas C tokenizer
+    - Stores house number ranges in a packed NumPy array sorted by PC6
+    - Interns names; keeps PC6 keys in a sorted U6 array and grouped ids
+      (PC4 cities, street/city PC6s) as sorted uint32 CSR arrays
     - Uses defaultdict for automatic key creation
     - LRU caching for frequent queries
     - Builds reverse indexes for fast lookups
+    - Caches the parsed data and indexes in an .npz file for warm starts
+    - Lazily builds BK-trees over normalized names for fuzzy lookups
     """
 
-    def __init__(self, data_dir: str = 'data'):
-        self.data_dir = Path(data_dir)
+    def __init__(self, data_dir: Optional[str] = None, use_cache: bool = True):
+        self.data_dir = Path(data_dir or DEFAULT_DATA_DIR)
+        self.use_cache = use_cache
 
         # Primary indexes
-        self._pc6_index: DefaultDict[str, List[Dict]] = defaultdict(list)
+        self._hnr_rows: np.ndarray = np.empty(0, dtype=HNR_DTYPE)
+        self._pc6_keys: np.ndarray = np.empty(0, dtype='U6')
+        self._pc6_offsets: np.ndarray = np.zeros(1, dtype=np.int64)
         self._street_map: Dict[int, str] = {}
         self._city_map: Dict[int, str] = {}
 
         # Reverse indexes for fast searching
         self._street_name_to_id: DefaultDict[str, List[int]] = defaultdict(list)
         self._city_name_to_id: DefaultDict[str, List[int]] = defaultdict(list)
-        self._pc4_index: DefaultDict[str, Set[int]] = defaultdict(set)
-        self._street_id_to_pc6: DefaultDict[int, Set[str]] = defaultdict(set)
 
-        self._load_all_data()
+        # Grouped (CSR) indexes: sorted keys, offsets, values per key
+        self._pc4_index: CsrIndex = _EMPTY_CSR
+        self._street_id_to_pc6: CsrIndex = _EMPTY_CSR
+        self._city_id_to_pc6: CsrIndex = _EMPTY_CSR
+
+        # Sorted (normalized name, id) pairs for prefix lookups
+        self._city_prefix_index: List[Tuple[str, int]] = []
+        self._street_prefix_index: List[Tuple[str, int]] = []
+
+        # Parallel name / normalized-name lists for fuzzy matching
+        self._all_city_names: List[str] = []
+        self._all_city_norms: List[str] = []
+        self._all_street_names: List[str] = []
+        self._all_street_norms: List[str] = []
+
+        if not (use_cache and self._load_index_cache()):
+            self._load_all_data()
+            if use_cache:
+                self._save_index_cache()
 
     def _load_all_data(self):
         """Load all data files."""
         self._load_wpl_data()
         self._load_str_data()
         self._load_hnr_data()
+        self._normalize_names()
+        self._build_reverse_indexes()
+
+    def _source_stats(self) -> np.ndarray:
+        """(size, mtime_ns) of every data file; raises OSError if one is missing."""
+        stats = [(self.data_dir / name).stat() for name in DATA_FILES]
+        return np.array([(st.st_size, st.st_mtime_ns) for st in stats], dtype=np.int64)
+
+    def _load_index_cache(self) -> bool:
+        """Restore parsed data and indexes from the index cache. Returns False if unusable."""
+        try:
+            with np.load(self.data_dir / INDEX_CACHE_FILE, allow_pickle=False) as cache:
+                if (int(cache['version']) != INDEX_CACHE_VERSION
+                        or not np.array_equal(cache['source_stats'], self._source_stats())):
+                    return False
+
+                city_ids = cache['city_ids'].tolist()
+                city_names = cache['city_names'].tolist()
+                city_norms = cache['city_norms'].tolist()
+                street_ids = cache['street_ids'].tolist()
+                street_names = cache['street_names'].tolist()
+                street_norms = cache['street_norms'].tolist()
+                hnr_rows = cache['hnr_rows']
+                pc6_keys = cache['pc6_keys']
+                pc6_offsets = cache['pc6_offsets']
+                csr_indexes = {
+                    name: CsrIndex(*(cache[f'{name}_{field}'] for field in CsrIndex._fields))
+                    for name in _CACHED_CSR_INDEXES
+                }
+        except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+            return False
+
+        intern = sys.intern
+        self._all_city_names = list(map(intern, city_names))
+        self._all_city_norms = list(map(intern, city_norms))
+        self._all_street_names = list(map(intern, street_names))
+        self._all_street_norms = list(map(intern, street_norms))
+        self._city_map = dict(zip(city_ids, self._all_city_names))
+        self._street_map = dict(zip(street_ids, self._all_street_names))
+        self._hnr_rows = hnr_rows
+        self._pc6_keys = pc6_keys
+        self._pc6_offsets = pc6_offsets
+        for name, index in csr_indexes.items():
+            setattr(self, f'_{name}', index)
         self._build_reverse_indexes()
+        return True
+
+    def _save_index_cache(self):
+        """Write parsed data to the index cache; skipped if the directory is read-only."""
+        cache_path = self.data_dir / INDEX_CACHE_FILE
+
+        # Unique temp file, so concurrent starts never write into each other's file
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix=INDEX_CACHE_FILE + '.', suffix='.tmp',
+                                            dir=self.data_dir)
+        except OSError:
+            return
+        tmp_path = Path(tmp_name)
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f,
+                    version=np.array(INDEX_CACHE_VERSION),
+                    source_stats=self._source_stats(),
+                    city_ids=np.array(list(self._city_map.keys()), dtype=np.int64),
+                    city_names=np.array(self._all_city_names, dtype=str),
+                    city_norms=np.array(self._all_city_norms, dtype=str),
+                    street_ids=np.array(list(self._street_map.keys()), dtype=np.int64),
+                    street_names=np.array(self._all_street_names, dtype=str),
+                    street_norms=np.array(self._all_street_norms, dtype=str),
+                    hnr_rows=self._hnr_rows,
+                    pc6_keys=self._pc6_keys,
+                    pc6_offsets=self._pc6_offsets,
+                    **{f'{name}_{field}': array
+                       for name in _CACHED_CSR_INDEXES
+                       for field, array in zip(CsrIndex._fields, getattr(self, f'_{name}'))},
+                )
+            os.chmod(tmp_path, 0o644)  # mkstemp creates it owner-only
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
 
     def _load_wpl_data(self):
         """Load city data (PCS_WPL.dat)."""
         wpl_path = self.data_dir / 'PCS_WPL.dat'
-
-        with open(wpl_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        intern = sys.intern
+
+        # Decode the whole file once and split it in memory
+        for line in wpl_path.read_text(encoding='utf-8', errors='ignore').splitlines():
+            # Handle ~ delimiter (from sample), fall back to |
+            city_id_str, sep, city_name = line.partition('~')
+            if not sep:
+                city_id_str, sep, city_name = line.partition('|')
+                if not sep:
                     continue
 
-                # Handle ~ delimiter (from sample)
-                if '~' in line:
-                    city_id_str, city_name = line.split('~', 1)
-                else:
-                    # Try other delimiters
-                    parts = line.replace('|', '~').split('~', 1)
-                    if len(parts) == 2:
-                        city_id_str, city_name = parts
-                    else:
-                        continue
-
-                try:
-                    city_id = int(city_id_str.strip())
-                    self._city_map[city_id] = city_name.strip()
-                except (ValueError, IndexError):
-                    continue
+            try:
+                self._city_map[int(city_id_str)] = intern(city_name.strip())
+            except ValueError:
+                continue
 
     def _load_str_data(self):
         """Load street data (PCS_STR.dat)."""
         str_path = self.data_dir / 'PCS_STR.dat'
-
-        with open(str_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Try different delimiters
-                if '~' in line:
-                    street_id_str, street_name = line.split('~', 1)
-                elif '|' in line:
-                    street_id_str, street_name = line.split('|', 1)
-                else:
+        intern = sys.intern
+
+        # Decode the whole file once and split it in memory
+        for line in str_path.read_text(encoding='utf-8', errors='ignore').splitlines():
+            # Try different delimiters
+            street_id_str, sep, street_name = line.partition('~')
+            if not sep:
+                street_id_str, sep, street_name = line.partition('|')
+                if not sep:
                     parts = line.split(None, 1)
-                    if len(parts) == 2:
-                        street_id_str, street_name = parts
-                    else:
+                    if len(parts) != 2:
                         continue
+                    street_id_str, street_name = parts
 
-                try:
-                    street_id = int(street_id_str.strip())
-                    self._street_map[street_id] = street_name.strip()
-                except (ValueError, IndexError):
-                    continue
+            try:
+                self._street_map[int(street_id_str)] = intern(street_name.strip())
+            except ValueError:
+                continue
 
     def _load_hnr_data(self):
         """Load postcode-house number data (PCS_HNR.dat)."""
         hnr_path = self.data_dir / 'PCS_HNR.dat'
 
-        with open(hnr_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Split by pipe (expected format)
-                parts = line.split('|')
-                if len(parts) < 5:
-                    continue
-
-                try:
-                    pc6 = parts[0].strip()
-                    if len(pc6) != 6:
-                        continue
-
-                    hnr_from = int(parts[1]) if parts[1].strip() else 0
-                    hnr_to = int(parts[2]) if parts[2].strip() else hnr_from
+        # Tokenize with pandas' C parser; pipe delimited, extra columns ignored,
+        # quotes kept as data. A file where no line has 5 fields (e.g. another
+        # delimiter) has no valid rows, like an empty one.
+        try:
+            raw = pd.read_csv(hnr_path, sep='|', header=None, names=range(5),
+                              usecols=range(5), index_col=False, dtype={0: str},
+                              quoting=csv.QUOTE_NONE, skipinitialspace=True,
+                              low_memory=False, encoding='utf-8', encoding_errors='ignore',
+                              on_bad_lines='skip', engine='c')
+        except (pd.errors.EmptyDataError, pd.errors.ParserError):
+            raw = pd.DataFrame({i: pd.Series(dtype=str) for i in range(5)})
+
+        # Blank hnr_from defaults to 0, blank hnr_to to hnr_from; rows with
+        # unparsable, non-integral or negative numbers or missing ids are skipped
+        hnr_from = np.where(raw[1].isna(), 0, self._to_uint(raw[1]))
+        hnr_to = np.where(raw[2].isna(), hnr_from, self._to_uint(raw[2]))
+        street_ids = self._to_uint(raw[3])
+        city_ids = self._to_uint(raw[4])
+
+        pc6 = raw[0].str.strip()
+        valid = (pc6.str.len() == 6).to_numpy(dtype=bool, na_value=False, copy=True)
+        for values in (hnr_from, hnr_to, street_ids, city_ids):
+            valid &= ~np.isnan(values)
+
+        # Factorize PC6 once, then order rows by the rank of their PC6
+        # (stable, so file order is kept within a PC6)
+        codes, uniques = pd.factorize(pc6[valid])
+        pc6_keys = np.asarray(uniques, dtype='U6')
+        key_order = np.argsort(pc6_keys, kind='stable')
+        ranks = np.empty(len(key_order), dtype=np.int64)
+        ranks[key_order] = np.arange(len(key_order))
+        codes = ranks[codes]
+        row_order = np.argsort(codes, kind='stable')
+
+        self._hnr_rows = np.empty(len(row_order), dtype=HNR_DTYPE)
+        for field, values in zip(HNR_DTYPE.names, (hnr_from, hnr_to, street_ids, city_ids)):
+            self._hnr_rows[field] = values[valid][row_order]
+
+        self._index_hnr_rows(pc6_keys[key_order], codes[row_order])
 
-                    street_id = int(parts[3]) if parts[3].strip() else None
-                    city_id = int(parts[4]) if parts[4].strip() else None
-
-                    if street_id is None or city_id is None:
-                        continue
-
-                    entry = {
-                        'pc6': pc6,
-                        'hnr_from': hnr_from,
-                        'hnr_to': hnr_to,
-                        'street_id': street_id,
-                        'city_id': city_id
-                    }
-
-                    self._pc6_index[pc6].append(entry)
-                    self._pc4_index[pc6[:4]].add(city_id)
-                    self._street_id_to_pc6[street_id].add(pc6)
-
-                except (ValueError, IndexError):
-                    continue
+    @staticmethod
+    def _to_uint(column: pd.Series) -> np.ndarray:
+        """Parse a column as float64, with NaN for anything that is not a u4 integer."""
+        values = pd.to_numeric(column, errors='coerce')
+        values = values.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        values[(values % 1 != 0) | (values < 0) | (values > _UINT32_MAX)] = np.nan
+        return values
+
+    def _index_hnr_rows(self, pc6_keys: np.ndarray, codes: np.ndarray):
+        """
+        Build PC6 offsets and secondary indexes from the sorted HNR rows.
+
+        Args:
+            pc6_keys: Sorted distinct PC6 values
+            codes: Per-row index into pc6_keys (non-decreasing)
+        """
+        self._pc6_keys = pc6_keys
+        self._pc6_offsets = np.zeros(len(pc6_keys) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(pc6_keys)), out=self._pc6_offsets[1:])
+
+        rows = self._hnr_rows
+        self._street_id_to_pc6 = _group_pairs(rows['street_id'], codes)
+        self._city_id_to_pc6 = _group_pairs(rows['city_id'], codes)
+
+        # PC4 -> city ids, keyed by PC4 string
+        pc4_keys, pc4_codes = np.unique(pc6_keys.astype('U4'), return_inverse=True)
+        pc4_index = _group_pairs(pc4_codes[codes], rows['city_id'])
+        self._pc4_index = CsrIndex(pc4_keys[pc4_index.keys], pc4_index.offsets, pc4_index.values)
+
+    def _pc6_slice(self, pc6: str) -> slice:
+        """Slice of _hnr_rows holding a PC6; empty if the PC6 is unknown."""
+        return _csr_slice(self._pc6_keys, self._pc6_offsets, pc6)
+
+    def _normalize_names(self):
+        """Fill the parallel name / normalized-name lists from the id maps."""
+        self._all_city_names = list(self._city_map.values())
+        self._all_city_norms = [sys.intern(self._normalize_name(name))
+                                for name in self._all_city_names]
+        self._all_street_names = list(self._street_map.values())
+        self._all_street_norms = [sys.intern(self._normalize_name(name))
+                                  for name in self._all_street_names]
 
     def _build_reverse_indexes(self):
         """Build reverse indexes for name-based lookups."""
-        for city_id, city_name in self._city_map.items():
-            normalized = self._normalize_name(city_name)
+        for city_id, normalized in zip(self._city_map, self._all_city_norms):
             self._city_name_to_id[normalized].append(city_id)
 
-        for street_id, street_name in self._street_map.items():
-            normalized = self._normalize_name(street_name)
+        for street_id, normalized in zip(self._street_map, self._all_street_norms):
             self._street_name_to_id[normalized].append(street_id)
 
+        self._city_prefix_index = sorted(
+            (name, city_id) for name, ids in self._city_name_to_id.items() for city_id in ids
+        )
+        self._street_prefix_index = sorted(
+            (name, street_id) for name, ids in self._street_name_to_id.items() for street_id in ids
+        )
+
+    @cached_property
+    def _city_bktree(self) -> pybktree.BKTree:
+        """BK-tree over distinct normalized city names, built on first use."""
+        return pybktree.BKTree(Levenshtein.distance, sorted(self._city_name_to_id))
+
+    @cached_property
+    def _street_bktree(self) -> pybktree.BKTree:
+        """BK-tree over distinct normalized street names, built on first use."""
+        return pybktree.BKTree(Levenshtein.distance, sorted(self._street_name_to_id))
+
+    @cached_property
+    def _street_codes(self) -> Optional[Tuple[List[str], np.ndarray, np.ndarray]]:
+        """
+        Distinct normalized street names as zero-padded uint8 rows for the
+        Numba distance kernel, built on first use.
+
+        Returns None when the names are not all ASCII.
+        """
+        names = sorted(self._street_name_to_id)
+        if not names or not all(name.isascii() for name in names):
+            return None
+        encoded = np.array([name.encode('ascii') for name in names])
+        codes = encoded.view(np.uint8).reshape(len(names), encoded.itemsize)
+        lens = np.fromiter(map(len, names), dtype=np.int32, count=len(names))
+        return names, codes, lens
+
+    @staticmethod
+    def _ids_with_prefix(index: List[Tuple[str, int]], prefix: str) -> Iterator[int]:
+        """Yield ids whose normalized name starts with prefix, in name order."""
+        for i in range(bisect_left(index, (prefix,)), len(index)):
+            name, item_id = index[i]
+            if not name.startswith(prefix):
+                break
+            yield item_id
+
     @staticmethod
+    @lru_cache(maxsize=50000)
     def _normalize_name(name: str) -> str:
         """Normalize name for case-insensitive comparison."""
-        name = unicodedata.normalize('NFKD', name)
-        name = name.lower()
-        name = re.sub(r'[^\w\s]', ' ', name)
-        name = re.sub(r'\s+', ' ', name).strip()
-        return name
+        name = unicodedata.normalize('NFKD', name).lower().translate(_PUNCT_MAP)
+        return ' '.join(name.split())
 
     # Public API with caching
 
     @lru_cache(maxsize=10000)
     def get_addresses_by_pc6(self, pc6: str) -> List[Dict]:
         """Get entries for a specific PC6."""
-        return self._pc6_index.get(pc6.upper(), [])
+        pc6 = pc6.upper()
+        rows = self._hnr_rows[self._pc6_slice(pc6)]
+        return [
+            {'pc6': pc6, 'hnr_from': hnr_from, 'hnr_to': hnr_to,
+             'street_id': street_id, 'city_id': city_id}
+            for hnr_from, hnr_to, street_id, city_id in rows.tolist()
+        ]
 
-    @lru_cache(maxsize=1000)
     def get_cities_by_pc4(self, pc4: str) -> Set[int]:
         """Get city IDs for a PC4."""
-        return self._pc4_index.get(pc4, set())
+        return set(self.get_city_ids_by_pc4(pc4).tolist())
+
+    def get_city_ids_by_pc4(self, pc4: str) -> np.ndarray:
+        """Get the sorted city ids of a PC4 as an array."""
+        pc4_index = self._pc4_index
+        return pc4_index.values[_csr_slice(pc4_index.keys, pc4_index.offsets, pc4)]
+
+    def get_street_ids_by_pc6(self, pc6: str) -> np.ndarray:
+        """Get the street id of every HNR row in a PC6 (may repeat)."""
+        return self._hnr_rows['street_id'][self._pc6_slice(pc6.upper())]
 
     def get_city_by_id(self, city_id: int) -> Optional[str]:
         """Get city name by ID."""
@@ -183,8 +460,7 @@ class DataLoader:
         city_ids = self._city_name_to_id.get(normalized, [])
 
         if pc4:
-            pc4_cities = self.get_cities_by_pc4(pc4)
-            city_ids = [cid for cid in city_ids if cid in pc4_cities]
+            city_ids = np.intersect1d(city_ids, self.get_city_ids_by_pc4(pc4)).tolist()
 
         return city_ids
 
@@ -194,20 +470,80 @@ class DataLoader:
         street_ids = self._street_name_to_id.get(normalized, [])
 
         if pc6:
-            pc6_entries = self.get_addresses_by_pc6(pc6)
-            pc6_street_ids = {e['street_id'] for e in pc6_entries if e.get('street_id')}
-            street_ids = [sid for sid in street_ids if sid in pc6_street_ids]
+            street_ids = list(set(street_ids) & set(self.get_street_ids_by_pc6(pc6).tolist()))
 
         return street_ids
 
+    def find_addresses_by_name_prefix(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """Find entries (one per PC6) for cities and streets whose name starts with prefix."""
+        normalized = self._normalize_name(prefix)
+
+        if not normalized:
+            return []
+
+        return list(islice(self._iter_name_prefix_entries(normalized), limit))
+
+    def _iter_name_prefix_entries(self, normalized: str) -> Iterator[Dict]:
+        """
+        Yield the first resolvable entry per PC6 for each city, then street,
+        matching a normalized prefix; rows already yielded are skipped.
+        """
+        seen = set()
+
+        for index, id_to_pc6, key in ((self._city_prefix_index, self._city_id_to_pc6, 'city_id'),
+                                      (self._street_prefix_index, self._street_id_to_pc6, 'street_id')):
+            for item_id in self._ids_with_prefix(index, normalized):
+                pc6_codes = id_to_pc6.values[_csr_slice(id_to_pc6.keys, id_to_pc6.offsets, item_id)]
+                for pc6 in self._pc6_keys[pc6_codes].tolist():
+                    for row, entry in enumerate(self.get_addresses_by_pc6(pc6)):
+                        if (entry[key] == item_id
+                                and entry['street_id'] in self._street_map
+                                and entry['city_id'] in self._city_map):
+                            if (pc6, row) not in seen:
+                                seen.add((pc6, row))
+                                yield entry
+                            break
+
+    def find_close_street_names(self, normalized: str, max_distance: int,
+                                limit: int) -> List[Tuple[int, str]]:
+        """
+        Find distinct normalized street names within an edit distance.
+
+        Uses the compiled Numba kernel when available, the BK-tree otherwise;
+        both give the same (distance, name) pairs, closest first then by name.
+
+        Args:
+            normalized: Normalized street name
+            max_distance: Maximum Levenshtein distance
+            limit: Maximum number of names
+
+        Returns:
+            List of (distance, normalized name) tuples
+        """
+        batch_lev = _load_batch_lev() if normalized.isascii() else None
+        table = self._street_codes if batch_lev is not None else None
+        if table is None:
+            return sorted(self._street_bktree.find(normalized, max_distance))[:limit]
+
+        names, codes, lens = table
+        distances = np.empty(len(names), dtype=np.int32)
+        batch_lev(np.frombuffer(normalized.encode('ascii'), dtype=np.uint8),
+                  codes, lens, distances, max_distance)
+
+        # Names are sorted, so (distance, index) order is (distance, name) order
+        hits = np.flatnonzero(distances <= max_distance)
+        keys = distances[hits].astype(np.int64) * len(names) + hits
+        if 0 < limit < len(hits):
+            top = np.argpartition(keys, limit - 1)[:limit]
+            hits, keys = hits[top], keys[top]
+
+        return [(int(distances[i]), names[i]) for i in hits[np.argsort(keys)][:limit]]
+
     def is_house_number_valid(self, street_id: int, pc6: str,
                               house_number: int) -> bool:
         """Check if house number is valid."""
-        entries = self.get_addresses_by_pc6(pc6)
-
-        for entry in entries:
-            if entry.get('street_id') == street_id:
-                if entry['hnr_from'] <= house_number <= entry['hnr_to']:
-                    return True
+        rows = self._hnr_rows[self._pc6_slice(pc6.upper())]
 
-        return False
\ No newline at end of file
+        return bool(np.any((rows['street_id'] == street_id)
+                           & (rows['hnr_from'] <= house_number)
+                           & (house_number <= rows['hnr_to'])))
\ No newline at end of file
@@ -1,7 +1,95 @@
-import re
-from typing import List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from .address import Address, DutchAddressHandler
 
+if TYPE_CHECKING:
+    from .data_loader import DataLoader
+
+_HANDLER: Optional[DutchAddressHandler] = None
+
+
+class AddressValidator:
+    """Validate addresses against the postal data indexes."""
+
+    def __init__(self, data_loader: 'DataLoader'):
+        self.data = data_loader
+
+    def validate(self, address: Address) -> bool:
+        """
+        Validate an address.
+
+        Args:
+            address: Address to validate
+
+        Returns:
+            True if street, house number, postcode and city match, False otherwise
+        """
+        return self._matches(address.street_name, address.house_number,
+                             address.pc6, address.city)
+
+    def validate_components(self, street_name: str, house_number: int,
+                            house_number_extension: str, postcode: str,
+                            city: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Validate raw address components without building an Address.
+
+        Args:
+            street_name: Name of the street
+            house_number: House number (integer)
+            house_number_extension: House number extension (letter/s)
+            postcode: Postal code (format: '1234 AB' or '1234AB')
+            city: City name
+
+        Returns:
+            Tuple of validity and, for valid addresses, the normalized
+            address dict (same shape as Address.to_dict), otherwise None
+        """
+        postcode = _normalize_postcode(postcode)
+        pc6 = postcode.replace(' ', '')
+        if not self._matches(street_name, house_number, pc6, city):
+            return False, None
+
+        return True, {
+            'street_name': street_name,
+            'house_number': house_number,
+            'house_number_extension': house_number_extension.upper(),
+            'postcode': postcode,
+            'city': city,
+            'pc4': pc6[:4],
+            'pc6': pc6
+        }
+
+    def _matches(self, street_name: str, house_number: int,
+                 pc6: str, city: str) -> bool:
+        """Check normalized components against the indexes."""
+        if len(pc6) != 6:
+            return False
+
+        # City must be served by the PC4 area
+        if not self.data.find_city_ids_by_name(city, pc6[:4]):
+            return False
+
+        # Street must exist in the PC6 area with the house number in range
+        for street_id in self.data.find_street_ids_by_name(street_name, pc6):
+            if self.data.is_house_number_valid(street_id, pc6, house_number):
+                return True
+
+        return False
+
+
+@lru_cache(maxsize=10000)
+def _normalize_postcode(postcode: str) -> str:
+    """Cached Address postcode normalization for the component path."""
+    return Address._normalize_postcode(postcode)
+
+
+def _get_handler() -> DutchAddressHandler:
+    """Return the shared handler, loading the data files on first use."""
+    global _HANDLER
+    if _HANDLER is None:
+        _HANDLER = DutchAddressHandler()
+    return _HANDLER
+
 
 def validate(street_name: str, house_number: int,
              house_number_extension: str, postcode: str, city: str) -> bool:
@@ -18,10 +106,8 @@ def validate(street_name: str, house_number: int,
     Returns:
         True if address is valid, False otherwise
     """
-    # Create a handler with default data directory
-    handler = DutchAddressHandler()
-    return handler.validate(street_name, house_number,
-                            house_number_extension, postcode, city)
+    return _get_handler().validate(street_name, house_number,
+                                   house_number_extension, postcode, city)
 
 
 def validate_lines(address_lines: List[str]) -> bool:
@@ -34,5 +120,4 @@ def validate_lines(address_lines: List[str]) -> bool:
     Returns:
         True if address is valid, False otherwise
     """
-    handler = DutchAddressHandler()
-    return handler.validate_lines(address_lines)
\ No newline at end of file
+    return _get_handler().validate_lines(address_lines)
@@ -12,16 +12,22 @@ setup(
         "fastapi>=0.104.0",
         "uvicorn>=0.24.0",
         "pydantic>=2.4.0",
+        "rapidfuzz>=3.0.0",
+        "numpy>=1.24.0",
+        "pandas>=2.0.0",
+        "pybktree>=1.1",
     ],
     extras_require={
         "dev": [
             "pytest>=7.0.0",
+            "httpx>=0.24.0",
             "black>=23.0.0",
             "mypy>=1.0.0",
         ],
         "full": [
             "python-Levenshtein>=0.21.0",
-            "rapidfuzz>=3.0.0",
+            "numba>=0.58.0",
+            "orjson>=3.8.0",
         ]
     },
     python_requires=">=3.11",
@@ -0,0 +1,48 @@
+import pytest
+from dutch_postal_address.address import DutchAddressHandler
+from dutch_postal_address.data_loader import DataLoader
+
+
+# Cities
+_WPL_BYTES = b"""1000~AMSTERDAM
+3800~AMERSFOORT
+3811~AMERSFOORT
+9999~TEST CITY"""
+
+# Streets
+_STR_BYTES = b"""12345~SMALLEPAD
+12346~KALVERSTRAAT
+99999~TEST STREET"""
+
+# Postcodes and house numbers
+_HNR_BYTES = b"""3811MG|30|30|12345|3811|
+3811MG|31|50|12345|3811|
+1012PA|1|100|12346|1000|
+9999ZZ|1|999|99999|9999|"""
+
+
+def _write_fixtures(data_dir):
+    """Write the minimal PCS data files shared by the test modules."""
+    (data_dir / "PCS_WPL.dat").write_bytes(_WPL_BYTES)
+    (data_dir / "PCS_STR.dat").write_bytes(_STR_BYTES)
+    (data_dir / "PCS_HNR.dat").write_bytes(_HNR_BYTES)
+
+
+@pytest.fixture(scope="session")
+def shared_data_dir(tmp_path_factory):
+    """Data directory with the shared test files, written once per run."""
+    data_dir = tmp_path_factory.mktemp("pcs")
+    _write_fixtures(data_dir)
+    return data_dir
+
+
+@pytest.fixture(scope="session")
+def loader(shared_data_dir):
+    """DataLoader over the shared test data, indexed once per run."""
+    return DataLoader(str(shared_data_dir))
+
+
+@pytest.fixture(scope="session")
+def handler(shared_data_dir):
+    """DutchAddressHandler over the shared test data."""
+    return DutchAddressHandler(data_dir=str(shared_data_dir))
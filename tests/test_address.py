@@ -1,19 +1,27 @@
+import dataclasses
+
 import pytest
 from dutch_postal_address import Address, DutchAddressHandler
 
 
+@pytest.fixture(scope="module")
+def smallepad():
+    """Canonical Address shared by the read-only Address tests."""
+    return Address(
+        street_name="Smallepad",
+        house_number=30,
+        house_number_extension="E",
+        postcode="3811 MG",
+        city="Amersfoort"
+    )
+
+
 class TestAddress:
     """Test Address class functionality."""
 
-    def test_address_creation(self):
+    def test_address_creation(self, smallepad):
         """Test basic address creation."""
-        address = Address(
-            street_name="Smallepad",
-            house_number=30,
-            house_number_extension="E",
-            postcode="3811 MG",
-            city="Amersfoort"
-        )
+        address = smallepad
 
         assert address.street_name == "Smallepad"
         assert address.house_number == 30
@@ -35,49 +43,45 @@ class TestAddress:
         with pytest.raises(Exception):
             address.street_name = "Modified"
 
-    def test_postcode_normalization(self):
+    @pytest.mark.parametrize("input_pc,expected_pc", [
+        ("1234AB", "1234 AB"),
+        ("1234 AB", "1234 AB"),
+        ("1234  AB", "1234 AB"),
+        ("1234ab", "1234 AB"),
+        ("  1234AB  ", "1234 AB"),
+    ])
+    def test_postcode_normalization(self, input_pc, expected_pc):
         """Test postcode normalization."""
-        test_cases = [
-            ("1234AB", "1234 AB"),
-            ("1234 AB", "1234 AB"),
-            ("1234  AB", "1234 AB"),
-            ("1234ab", "1234 AB"),
-            ("  1234AB  ", "1234 AB"),
-        ]
-
-        for input_pc, expected_pc in test_cases:
-            address = Address(
-                street_name="Test",
-                house_number=1,
-                house_number_extension="",
-                postcode=input_pc,
-                city="Test"
-            )
-            assert address.postcode == expected_pc
-
-    def test_properties(self):
-        """Test address properties."""
         address = Address(
             street_name="Test",
             house_number=1,
-            house_number_extension="A",
-            postcode="1234 AB",
+            house_number_extension="",
+            postcode=input_pc,
             city="Test"
         )
+        assert address.postcode == expected_pc
 
-        assert address.pc4 == "1234"
-        assert address.pc6 == "1234AB"
-        assert address.house_number_extension == "A"
+    def test_properties(self, smallepad):
+        """Test address properties."""
+        address = smallepad
+
+        assert address.pc4 == "3811"
+        assert address.pc6 == "3811MG"
+        assert address.house_number_extension == "E"
 
-    def test_to_lines(self):
+    def test_dataclass_fields(self, smallepad):
+        """Test only the address components are dataclass fields."""
+        assert dataclasses.asdict(smallepad) == {
+            'street_name': "Smallepad",
+            'house_number': 30,
+            'house_number_extension': "E",
+            'postcode': "3811 MG",
+            'city': "Amersfoort",
+        }
+
+    def test_to_lines(self, smallepad):
         """Test conversion to two-line format."""
-        address = Address(
-            street_name="Smallepad",
-            house_number=30,
-            house_number_extension="E",
-            postcode="3811 MG",
-            city="Amersfoort"
-        )
+        address = smallepad
 
         lines = address.to_lines()
 
@@ -97,15 +101,9 @@ class TestAddress:
         lines2 = address2.to_lines()
         assert lines2[0] == "Kalverstraat 1"
 
-    def test_to_dict(self):
+    def test_to_dict(self, smallepad):
         """Test conversion to dictionary."""
-        address = Address(
-            street_name="Smallepad",
-            house_number=30,
-            house_number_extension="E",
-            postcode="3811 MG",
-            city="Amersfoort"
-        )
+        address = smallepad
 
         data = address.to_dict()
 
@@ -150,42 +148,33 @@ class TestAddress:
         assert address3.postcode == "3811 MG"
         assert address3.city == "amersfoort"
 
-    def test_from_lines_invalid(self):
+    @pytest.mark.parametrize("lines", [
+        ["Single line"],                      # Too few lines
+        ["Line 1", "Line 2", "Line 3"],       # Too many lines
+        ["NoNumber", "1234 AB  City"],        # Invalid street format
+        ["Street 1", "Invalid  City"],        # Invalid postcode format
+    ])
+    def test_from_lines_invalid(self, lines):
         """Test invalid line formats."""
-        # Too few lines
         with pytest.raises(ValueError):
-            Address.from_lines(["Single line"])
-
-        # Too many lines
-        with pytest.raises(ValueError):
-            Address.from_lines(["Line 1", "Line 2", "Line 3"])
-
-        # Invalid street format
-        with pytest.raises(ValueError):
-            Address.from_lines(["NoNumber", "1234 AB  City"])
-
-        # Invalid postcode format
-        with pytest.raises(ValueError):
-            Address.from_lines(["Street 1", "Invalid  City"])
-
-    def test_extension_normalization(self):
+            Address.from_lines(lines)
+
+    @pytest.mark.parametrize("input_ext,expected_ext", [
+        ("e", "E"),
+        ("E", "E"),
+        ("aB", "AB"),
+        ("", ""),
+    ])
+    def test_extension_normalization(self, input_ext, expected_ext):
         """Test house number extension normalization."""
-        test_cases = [
-            ("e", "E"),
-            ("E", "E"),
-            ("aB", "AB"),
-            ("", ""),
-        ]
-
-        for input_ext, expected_ext in test_cases:
-            address = Address(
-                street_name="Test",
-                house_number=1,
-                house_number_extension=input_ext,
-                postcode="1234 AB",
-                city="Test"
-            )
-            assert address.house_number_extension == expected_ext
+        address = Address(
+            street_name="Test",
+            house_number=1,
+            house_number_extension=input_ext,
+            postcode="1234 AB",
+            city="Test"
+        )
+        assert address.house_number_extension == expected_ext
 
 
 class TestDutchAddressHandler:
@@ -202,10 +191,8 @@ class TestDutchAddressHandler:
             # It's OK if it fails due to missing data files
             pass
 
-    def test_parse_address(self):
+    def test_parse_address(self, handler):
         """Test address parsing in handler."""
-        handler = DutchAddressHandler(data_dir="test_data")
-
         # Valid address
         lines = ["Smallepad 30E", "3811 MG  Amersfoort"]
         address = handler.parse_address(lines)
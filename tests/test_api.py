@@ -0,0 +1,51 @@
+import warnings
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def client(handler):
+    """API test client backed by the shared test data."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("dutch_postal_address.validator._HANDLER", handler)
+        from dutch_postal_address import api
+        mp.setattr(api, "handler", handler)
+        yield TestClient(api.app)
+
+
+class TestApi:
+    """Test the HTTP endpoints."""
+
+    def test_correct_city_batch(self, client):
+        """Test POST /correct/city/batch returns one result per input, in order."""
+        cities = ["amsterdm", "AMERSFOORT", "xq"]
+        response = client.post("/correct/city/batch", json={"cities": cities})
+        assert response.status_code == 200
+
+        body = response.json()
+        assert body["count"] == 3
+        assert [r["input"] for r in body["results"]] == cities
+        assert [r["suggestions"] for r in body["results"]] == [["AMSTERDAM"], ["AMERSFOORT"], []]
+        assert [r["count"] for r in body["results"]] == [1, 1, 0]
+
+    def test_correct_city_batch_limit(self, client):
+        """Test the per-city limit and the batch size cap."""
+        response = client.post("/correct/city/batch", params={"limit": 1},
+                               json={"cities": ["amrsfrt"]})
+        assert response.status_code == 200
+        assert response.json()["results"][0]["count"] <= 1
+
+        response = client.post("/correct/city/batch", json={"cities": ["amsterdam"] * 101})
+        assert response.status_code == 422
+
+    def test_no_deprecation_warnings(self, client):
+        """Test requests do not trigger per-request FastAPI deprecation warnings."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            response = client.get("/correct/city", params={"city": "amsterdm"})
+        assert response.json()["suggestions"] == ["AMSTERDAM"]
+        assert [str(w.message) for w in caught] == []
@@ -0,0 +1,82 @@
+import pytest
+from dutch_postal_address.address import DutchAddressHandler
+
+
+@pytest.fixture(scope="module")
+def corrector(handler):
+    """AddressCorrector over the shared test data."""
+    return handler.corrector
+
+
+class TestAddressCorrector:
+    """Test fuzzy correction and address search."""
+
+    def test_correct_city(self, corrector):
+        """Test exact, close-edit and postcode-filtered city correction."""
+        assert corrector.correct_city("amsterdam") == ["AMSTERDAM"]
+        assert corrector.correct_city("amsterdm") == ["AMSTERDAM"]
+        assert corrector.correct_city("amersfort") == ["AMERSFOORT"]
+        assert corrector.correct_city("amersfort", "3811") == ["AMERSFOORT"]
+        assert corrector.correct_city("amersfoort", "1012") == []
+        assert corrector.correct_city("zzzzzz") == []
+
+    @pytest.mark.parametrize("query", ["xq", "ee", "a"])
+    def test_correct_short_queries(self, corrector, query):
+        """Test short queries are not padded out with far-fetched matches."""
+        assert corrector.correct_city(query) == []
+        assert corrector.correct_street(query) == []
+
+    def test_correct_street(self, corrector):
+        """Test exact, close-edit and postcode-filtered street correction."""
+        assert corrector.correct_street("smallepad") == ["SMALLEPAD"]
+        assert corrector.correct_street("smalepad") == ["SMALLEPAD"]
+        assert corrector.correct_street("kalverstrat") == ["KALVERSTRAAT"]
+        assert corrector.correct_street("smalepad", "3811 MG") == ["SMALLEPAD"]
+        assert corrector.correct_street("smallepad", "1012PA") == []
+        assert corrector.correct_street("zzzzzz") == []
+
+    def test_correct_many_cities(self, corrector):
+        """Test batch correction matches correct_city for each input."""
+        cities = ["amsterdam", "amsterdm", "amersfort", "Test Cty", "xq", "zzzzzz", "amsterdam"]
+        assert corrector.correct_many_cities(cities) == [corrector.correct_city(c) for c in cities]
+        assert corrector.correct_many_cities(cities)[:3] == [["AMSTERDAM"], ["AMSTERDAM"], ["AMERSFOORT"]]
+        assert corrector.correct_many_cities([]) == []
+
+    def test_correct_many_cities_ranked(self, corrector):
+        """Test fuzzy-scan suggestions are ranked by score and respect limit."""
+        # Too far for the BK-tree, so these go through the batched scan
+        cities = ["amstrdm xx", "amrsfrt", "test citty town"]
+        for limit in (1, 2, 20):
+            expected = [corrector.correct_city(c, limit=limit) for c in cities]
+            assert corrector.correct_many_cities(cities, limit=limit) == expected
+            assert all(len(suggestions) <= limit for suggestions in expected)
+        assert corrector.correct_many_cities(["amstrdm xx"], limit=1) == [["AMSTERDAM"]]
+
+    def test_search_addresses(self, corrector):
+        """Test postcode and name prefix search."""
+        results = corrector.search_addresses("3811MG")
+        assert {r['street'] for r in results} == {"SMALLEPAD"}
+        assert all(r['postcode'] == "3811 MG" for r in results)
+
+        results = corrector.search_addresses("kalver")
+        assert results == [{
+            'street': "KALVERSTRAAT",
+            'city': "AMSTERDAM",
+            'postcode': "1012 PA",
+            'house_number_range': "1-100",
+        }]
+
+        assert [r['city'] for r in corrector.search_addresses("amers")] == ["AMERSFOORT"]
+        assert corrector.search_addresses("x") == []
+
+    def test_search_addresses_dedupe_and_dangling(self, tmp_path):
+        """Test a row matched by city and street is returned once and dangling ids are skipped."""
+        (tmp_path / "PCS_WPL.dat").write_text("1~KALVERDORP\n", encoding='utf-8')
+        (tmp_path / "PCS_STR.dat").write_text("7~KALVERSTRAAT\n", encoding='utf-8')
+        hnr_content = """1000AA|1|10|555|1|
+1000AB|1|10|7|1|"""
+        (tmp_path / "PCS_HNR.dat").write_text(hnr_content, encoding='utf-8')
+
+        handler = DutchAddressHandler(data_dir=str(tmp_path))
+        assert [r['postcode'] for r in handler.search_addresses("kalver", limit=1)] == ["1000 AB"]
+        assert [r['postcode'] for r in handler.search_addresses("kalver")] == ["1000 AB"]
@@ -1,86 +1,59 @@
-import pytest
-import tempfile
 import os
-from pathlib import Path
-from dutch_postal_address.data_loader import DataLoader
+import shutil
 
+import pytest
+from dutch_postal_address import data_loader
+from dutch_postal_address.data_loader import DataLoader, DATA_FILES, INDEX_CACHE_FILE
 
-class TestDataLoader:
-    """Test data loading functionality."""
 
-    def setup_method(self):
-        """Create temporary test data."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = Path(self.temp_dir)
-
-    def teardown_method(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-
-    def create_test_files(self):
-        """Create minimal test data files."""
-        # Create PCS_WPL.dat with ~ delimiter
-        wpl_content = """1000~AMSTERDAM
-3800~AMERSFOORT
-3811~AMERSFOORT
-9999~TEST CITY"""
-
-        wpl_path = self.data_dir / "PCS_WPL.dat"
-        wpl_path.write_text(wpl_content, encoding='utf-8')
+@pytest.fixture
+def data_dir(shared_data_dir, tmp_path):
+    """Private copy of the shared data files, so the index cache can be changed."""
+    for name in DATA_FILES:
+        shutil.copy2(shared_data_dir / name, tmp_path / name)
+    return tmp_path
 
-        # Create PCS_STR.dat
-        str_content = """12345~SMALLEPAD
-12346~KALVERSTRAAT
-99999~TEST STREET"""
 
-        str_path = self.data_dir / "PCS_STR.dat"
-        str_path.write_text(str_content, encoding='utf-8')
+@pytest.fixture
+def rebuilds(monkeypatch):
+    """Count full parses of the data files."""
+    calls = []
+    load_all_data = DataLoader._load_all_data
 
-        # Create PCS_HNR.dat with pipe delimiter
-        hnr_content = """3811MG|30|30|12345|3811|
-3811MG|31|50|12345|3811|
-1012PA|1|100|12346|1000|
-9999ZZ|1|999|99999|9999|"""
+    def counting(self):
+        calls.append(self)
+        load_all_data(self)
 
-        hnr_path = self.data_dir / "PCS_HNR.dat"
-        hnr_path.write_text(hnr_content, encoding='utf-8')
+    monkeypatch.setattr(DataLoader, '_load_all_data', counting)
+    return calls
 
-    def test_data_loader_initialization(self):
-        """Test DataLoader can be initialized."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
 
+class TestDataLoader:
+    """Test data loading functionality."""
+
+    def test_data_loader_initialization(self, loader):
+        """Test DataLoader can be initialized."""
         assert loader is not None
         assert len(loader._city_map) > 0
         assert len(loader._street_map) > 0
-        assert len(loader._pc6_index) > 0
+        assert len(loader._hnr_rows) > 0
 
-    def test_city_loading(self):
+    def test_city_loading(self, loader):
         """Test city data is loaded correctly."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
-
         # Check specific cities
         assert loader.get_city_by_id(3811) == "AMERSFOORT"
         assert loader.get_city_by_id(1000) == "AMSTERDAM"
         assert loader.get_city_by_id(9999) == "TEST CITY"
         assert loader.get_city_by_id(99999) is None  # Non-existent ID
 
-    def test_street_loading(self):
+    def test_street_loading(self, loader):
         """Test street data is loaded correctly."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
-
         assert loader.get_street_by_id(12345) == "SMALLEPAD"
         assert loader.get_street_by_id(12346) == "KALVERSTRAAT"
         assert loader.get_street_by_id(99999) == "TEST STREET"
 
-    def test_pc6_index(self):
+    def test_pc6_index(self, loader):
         """Test postcode indexing."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
-
         # Check entries for a specific postcode
         entries = loader.get_addresses_by_pc6("3811MG")
         assert len(entries) == 2
@@ -93,17 +66,17 @@ class TestDataLoader:
         assert entry['hnr_from'] == 30
         assert entry['hnr_to'] == 30
 
-    def test_pc4_index(self):
+    def test_pc4_index(self, loader):
         """Test PC4 to city mapping."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
-
         cities_3811 = loader.get_cities_by_pc4("3811")
         assert 3811 in cities_3811
 
         cities_1012 = loader.get_cities_by_pc4("1012")
         assert 1000 in cities_1012
 
+        assert loader.get_city_ids_by_pc4("3811").tolist() == [3811]
+        assert loader.get_city_ids_by_pc4("0000").tolist() == []
+
     def test_normalize_name(self):
         """Test name normalization."""
         from dutch_postal_address.data_loader import DataLoader
@@ -122,11 +95,8 @@ class TestDataLoader:
             assert normalized == expected_normalized, \
                 f"Failed for '{input_name}': got '{normalized}', expected '{expected_normalized}'"
 
-    def test_find_city_ids_by_name(self):
+    def test_find_city_ids_by_name(self, loader):
         """Test finding city IDs by name."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
-
         # Exact match
         city_ids = loader.find_city_ids_by_name("AMERSFOORT")
         assert 3811 in city_ids
@@ -143,11 +113,8 @@ class TestDataLoader:
         city_ids = loader.find_city_ids_by_name("AMERSFOORT", "9999")
         assert 3811 not in city_ids
 
-    def test_find_street_ids_by_name(self):
+    def test_find_street_ids_by_name(self, loader):
         """Test finding street IDs by name."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
-
         # Exact match
         street_ids = loader.find_street_ids_by_name("SMALLEPAD")
         assert 12345 in street_ids
@@ -164,11 +131,8 @@ class TestDataLoader:
         street_ids = loader.find_street_ids_by_name("SMALLEPAD", "9999ZZ")
         assert 12345 not in street_ids
 
-    def test_house_number_validation(self):
+    def test_house_number_validation(self, loader):
         """Test house number validation."""
-        self.create_test_files()
-        loader = DataLoader(self.temp_dir)
-
         # Valid house numbers
         assert loader.is_house_number_valid(12345, "3811MG", 30) is True
         assert loader.is_house_number_valid(12345, "3811MG", 35) is True  # In range 31-50
@@ -179,17 +143,24 @@ class TestDataLoader:
         assert loader.is_house_number_valid(12345, "3811MG", 51) is False  # Above range
         assert loader.is_house_number_valid(99999, "3811MG", 1) is False  # Wrong street ID
 
-    def test_missing_data_files(self):
-        """Test error handling for missing data files."""
-        # Create empty directory
-        loader = DataLoader(self.temp_dir)
+    def test_find_close_street_names(self, loader):
+        """Test edit-distance street lookup matches the BK-tree."""
+        assert loader.find_close_street_names("smalepad", 2, 10) == [(1, "smallepad")]
+        assert loader.find_close_street_names("test streat", 2, 10) == [(1, "test street")]
+        assert loader.find_close_street_names("nowhere", 2, 10) == []
+
+        for query in ("kalverstrat", "tst street", ""):
+            assert (loader.find_close_street_names(query, 2, 10)
+                    == sorted(loader._street_bktree.find(query, 2))[:10])
 
+    def test_missing_data_files(self, tmp_path):
+        """Test error handling for missing data files."""
         # Should raise FileNotFoundError or similar
         with pytest.raises((FileNotFoundError, RuntimeError)):
-            # This will fail because files don't exist
-            loader._load_all_data()
+            # This will fail because the directory is empty
+            DataLoader(str(tmp_path))
 
-    def test_malformed_data(self):
+    def test_malformed_data(self, tmp_path):
         """Test handling of malformed data lines."""
         # Create malformed WPL file
         wpl_content = """invalid_line
@@ -197,13 +168,131 @@ class TestDataLoader:
 ~City without ID
 ID~"""
 
-        wpl_path = self.data_dir / "PCS_WPL.dat"
+        wpl_path = tmp_path / "PCS_WPL.dat"
         wpl_path.write_text(wpl_content, encoding='utf-8')
 
         # Create empty other files
-        (self.data_dir / "PCS_STR.dat").write_text("", encoding='utf-8')
-        (self.data_dir / "PCS_HNR.dat").write_text("", encoding='utf-8')
+        (tmp_path / "PCS_STR.dat").write_text("", encoding='utf-8')
+        (tmp_path / "PCS_HNR.dat").write_text("", encoding='utf-8')
 
         # Should handle gracefully (skip invalid lines)
-        loader = DataLoader(self.temp_dir)
-        assert loader.get_city_by_id(1000) == "AMSTERDAM"
\ No newline at end of file
+        loader = DataLoader(str(tmp_path))
+        assert loader.get_city_by_id(1000) == "AMSTERDAM"
+
+    def test_malformed_house_numbers(self, tmp_path):
+        """Test non-integral and negative house number rows are skipped."""
+        (tmp_path / "PCS_WPL.dat").write_text("1000~AMSTERDAM\n", encoding='utf-8')
+        (tmp_path / "PCS_STR.dat").write_text("7~KALVERSTRAAT\n", encoding='utf-8')
+        hnr_content = """1012AB|1|5|7|1000
+1012AC|1.5|5|7|1000
+1012AD|-3|5|7|1000
+1012AE||9|7|1000
+1012AF|x|5|7|1000"""
+        (tmp_path / "PCS_HNR.dat").write_text(hnr_content, encoding='utf-8')
+
+        loader = DataLoader(str(tmp_path), use_cache=False)
+        assert len(loader.get_addresses_by_pc6("1012AB")) == 1
+        assert loader.get_addresses_by_pc6("1012AC") == []
+        assert loader.get_addresses_by_pc6("1012AD") == []
+        assert loader.get_addresses_by_pc6("1012AF") == []
+        assert loader.get_addresses_by_pc6("1012AE")[0]['hnr_from'] == 0
+
+    def test_hnr_wrong_delimiter(self, tmp_path):
+        """Test an HNR file without '|' loads with no rows instead of failing."""
+        (tmp_path / "PCS_WPL.dat").write_text("1000~AMSTERDAM\n", encoding='utf-8')
+        (tmp_path / "PCS_STR.dat").write_text("7~KALVERSTRAAT\n", encoding='utf-8')
+        (tmp_path / "PCS_HNR.dat").write_text("2~1000~AA~1~49~~0~1000\n2~1000~AB~50~99~~0~1000",
+                                              encoding='utf-8')
+
+        loader = DataLoader(str(tmp_path), use_cache=False)
+        assert len(loader._hnr_rows) == 0
+        assert loader.get_city_by_id(1000) == "AMSTERDAM"
+
+    def test_hnr_stray_quote(self, tmp_path):
+        """Test a line with a stray quote is skipped without dropping the rest."""
+        (tmp_path / "PCS_WPL.dat").write_text("1000~AMSTERDAM\n", encoding='utf-8')
+        (tmp_path / "PCS_STR.dat").write_text("7~KALVERSTRAAT\n", encoding='utf-8')
+        hnr_content = """1012AB|1|5|7|1000|
+1012AC| "1|5|7|1000|
+1012AD|1|5|7|1000|"""
+        (tmp_path / "PCS_HNR.dat").write_text(hnr_content, encoding='utf-8')
+
+        loader = DataLoader(str(tmp_path), use_cache=False)
+        assert len(loader.get_addresses_by_pc6("1012AB")) == 1
+        assert loader.get_addresses_by_pc6("1012AC") == []
+        assert len(loader.get_addresses_by_pc6("1012AD")) == 1
+
+
+class TestIndexCache:
+    """Test the on-disk index cache."""
+
+    def test_round_trip(self, data_dir, rebuilds):
+        """Test a warm start restores the same data and indexes without parsing."""
+        cold = DataLoader(str(data_dir))
+        assert (data_dir / INDEX_CACHE_FILE).exists()
+        warm = DataLoader(str(data_dir))
+        assert len(rebuilds) == 1
+
+        assert warm._city_map == cold._city_map
+        assert warm._street_map == cold._street_map
+        assert warm._hnr_rows.tolist() == cold._hnr_rows.tolist()
+        assert warm.get_addresses_by_pc6("3811MG") == cold.get_addresses_by_pc6("3811MG")
+        assert warm.get_city_ids_by_pc4("3811").tolist() == [3811]
+        assert warm.find_city_ids_by_name("amersfoort", "3811") == [3811]
+        assert warm.find_addresses_by_name_prefix("kalver") == cold.find_addresses_by_name_prefix("kalver")
+
+    def test_version_mismatch(self, data_dir, rebuilds, monkeypatch):
+        """Test a cache written by another version is rebuilt."""
+        DataLoader(str(data_dir))
+        monkeypatch.setattr(data_loader, 'INDEX_CACHE_VERSION', data_loader.INDEX_CACHE_VERSION + 1)
+        DataLoader(str(data_dir))
+        assert len(rebuilds) == 2
+
+    def test_stale_cache(self, data_dir, rebuilds):
+        """Test a changed size or mtime of any data file invalidates the cache."""
+        DataLoader(str(data_dir))
+
+        wpl_path = data_dir / "PCS_WPL.dat"
+        wpl_path.write_bytes(wpl_path.read_bytes() + b"\n2000~NIEUWDORP")
+        assert DataLoader(str(data_dir)).get_city_by_id(2000) == "NIEUWDORP"
+        assert len(rebuilds) == 2
+
+        # An older mtime (e.g. a restored backup) must not reuse the cache either
+        hnr_path = data_dir / "PCS_HNR.dat"
+        st = hnr_path.stat()
+        os.utime(hnr_path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+        DataLoader(str(data_dir))
+        assert len(rebuilds) == 3
+
+    @pytest.mark.parametrize("content", [b"", b"not a zip", b"PK\x03\x04truncated"])
+    def test_corrupt_cache(self, data_dir, rebuilds, content):
+        """Test an empty, foreign or truncated cache file is rebuilt, not fatal."""
+        DataLoader(str(data_dir))
+        cache_path = data_dir / INDEX_CACHE_FILE
+        cache_path.write_bytes(content)
+
+        loader = DataLoader(str(data_dir))
+        assert loader.get_city_by_id(1000) == "AMSTERDAM"
+        assert len(rebuilds) == 2
+        assert DataLoader(str(data_dir)).get_city_by_id(1000) == "AMSTERDAM"
+        assert len(rebuilds) == 2
+
+    def test_truncated_cache(self, data_dir, rebuilds):
+        """Test a cache cut off mid-write is rebuilt."""
+        DataLoader(str(data_dir))
+        cache_path = data_dir / INDEX_CACHE_FILE
+        cache_path.write_bytes(cache_path.read_bytes()[:-100])
+
+        assert DataLoader(str(data_dir)).get_city_by_id(1000) == "AMSTERDAM"
+        assert len(rebuilds) == 2
+
+    def test_read_only_directory(self, data_dir, monkeypatch):
+        """Test the cache write is skipped when the directory is not writable."""
+        def read_only(*args, **kwargs):
+            raise PermissionError("read-only file system")
+
+        monkeypatch.setattr(data_loader.tempfile, 'mkstemp', read_only)
+        loader = DataLoader(str(data_dir))
+
+        assert loader.get_city_by_id(1000) == "AMSTERDAM"
+        assert sorted(p.name for p in data_dir.iterdir()) == sorted(DATA_FILES)
@@ -1,64 +1,56 @@
 import pytest
 from dutch_postal_address import validate, validate_lines
-from dutch_postal_address.address import Address, DutchAddressHandler
+from dutch_postal_address.address import Address
+from dutch_postal_address.validator import _get_handler
 
 
-class TestValidationFunctions:
-    """Test the public validation functions."""
-
-    def setup_method(self):
-        """Set up test data directory."""
-        import tempfile
-        import os
-        from pathlib import Path
-
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_dir = Path(self.temp_dir)
-
-        # Create minimal test data
-        self._create_test_data()
-
-        # Monkey patch the default data directory for tests
-        import dutch_postal_address.data_loader
-        self.original_data_dir = dutch_postal_address.data_loader.DEFAULT_DATA_DIR
-        dutch_postal_address.data_loader.DEFAULT_DATA_DIR = str(self.data_dir)
-
-        # Also patch the handler
-        import dutch_postal_address.address
-        self.original_handler_data_dir = dutch_postal_address.address.DEFAULT_DATA_DIR
-        dutch_postal_address.address.DEFAULT_DATA_DIR = str(self.data_dir)
-
-    def teardown_method(self):
-        """Clean up."""
-        import shutil
-        import dutch_postal_address.data_loader
-        import dutch_postal_address.address
-
-        shutil.rmtree(self.temp_dir)
-        dutch_postal_address.data_loader.DEFAULT_DATA_DIR = self.original_data_dir
-        dutch_postal_address.address.DEFAULT_DATA_DIR = self.original_handler_data_dir
-
-    def _create_test_data(self):
-        """Create test data files."""
-        # Cities
-        wpl_content = """1000~AMSTERDAM
+# Cities
+_WPL_BYTES = b"""1000~AMSTERDAM
 3800~AMERSFOORT
 3811~AMERSFOORT"""
-        (self.data_dir / "PCS_WPL.dat").write_text(wpl_content, encoding='utf-8')
 
-        # Streets
-        str_content = """12345~SMALLEPAD
+# Streets
+_STR_BYTES = b"""12345~SMALLEPAD
 12346~KALVERSTRAAT
 12347~DAMSTRAAT"""
-        (self.data_dir / "PCS_STR.dat").write_text(str_content, encoding='utf-8')
 
-        # Postcodes and house numbers
-        hnr_content = """3811MG|30|30|12345|3811|
+# Postcodes and house numbers
+_HNR_BYTES = b"""3811MG|30|30|12345|3811|
 3811MG|31|50|12345|3811|
 1012PA|1|100|12346|1000|
 1012PB|1|50|12346|1000|
 1012PC|51|100|12346|1000|"""
-        (self.data_dir / "PCS_HNR.dat").write_text(hnr_content, encoding='utf-8')
+
+
+def _create_test_data(data_dir):
+    """Create test data files."""
+    (data_dir / "PCS_WPL.dat").write_bytes(_WPL_BYTES)
+    (data_dir / "PCS_STR.dat").write_bytes(_STR_BYTES)
+    (data_dir / "PCS_HNR.dat").write_bytes(_HNR_BYTES)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _patch_data_dir(tmp_path_factory):
+    """Write the test data once and point the default data directory and handler at it."""
+    data_dir = tmp_path_factory.mktemp("validation")
+    _create_test_data(data_dir)
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr("dutch_postal_address.data_loader.DEFAULT_DATA_DIR", str(data_dir))
+    # Drop any handler built earlier on other data so validate() loads this one
+    mp.setattr("dutch_postal_address.validator._HANDLER", None)
+    yield data_dir
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def validation_handler(_patch_data_dir):
+    """The shared handler behind validate()/validate_lines(), on the test data."""
+    return _get_handler()
+
+
+class TestValidationFunctions:
+    """Test the public validation functions."""
 
     def test_validate_function(self):
         """Test the validate() function."""
@@ -101,31 +93,25 @@ class TestValidationFunctions:
 
     def test_validate_with_different_formats(self):
         """Test validation with different postcode formats."""
-        # Test without space
-        result1 = validate(
-            street_name="SMALLEPAD",
-            house_number=30,
-            house_number_extension="E",
-            postcode="3811MG",
-            city="AMERSFOORT"
-        )
+        # Both formats normalize to the same postcode before lookup
+        without_space = Address("SMALLEPAD", 30, "E", "3811MG", "AMERSFOORT")
+        with_space = Address("SMALLEPAD", 30, "E", "3811 MG", "AMERSFOORT")
+        assert without_space.pc6 == with_space.pc6
 
-        # Test with space
-        result2 = validate(
+        # End-to-end check of the unspaced format
+        result = validate(
             street_name="SMALLEPAD",
             house_number=30,
             house_number_extension="E",
-            postcode="3811 MG",
+            postcode="3811MG",
             city="AMERSFOORT"
         )
+        assert result is True
 
-        # Both should work
-        assert result1 == result2
-
-    def test_validate_house_number_ranges(self):
+    def test_validate_house_number_ranges(self, validation_handler):
         """Test house number range validation."""
         # House number 30 (exact match)
-        result1 = validate(
+        result1 = validation_handler.validate(
             street_name="SMALLEPAD",
             house_number=30,
             house_number_extension="",
@@ -134,7 +120,7 @@ class TestValidationFunctions:
         )
 
         # House number 40 (in range 31-50)
-        result2 = validate(
+        result2 = validation_handler.validate(
             street_name="SMALLEPAD",
             house_number=40,
             house_number_extension="",
@@ -143,7 +129,7 @@ class TestValidationFunctions:
         )
 
         # House number 60 (out of range)
-        result3 = validate(
+        result3 = validation_handler.validate(
             street_name="SMALLEPAD",
             house_number=60,
             house_number_extension="",
@@ -155,10 +141,10 @@ class TestValidationFunctions:
         assert result2 is True
         assert result3 is False
 
-    def test_validate_city_mismatch(self):
+    def test_validate_city_mismatch(self, validation_handler):
         """Test validation with wrong city for postcode."""
         # Correct city
-        result1 = validate(
+        result1 = validation_handler.validate(
             street_name="SMALLEPAD",
             house_number=30,
             house_number_extension="",
@@ -167,7 +153,7 @@ class TestValidationFunctions:
         )
 
         # Wrong city (Amsterdam instead of Amersfoort)
-        result2 = validate(
+        result2 = validation_handler.validate(
             street_name="SMALLEPAD",
             house_number=30,
             house_number_extension="",
@@ -178,34 +164,30 @@ class TestValidationFunctions:
         assert result1 is True
         assert result2 is False
 
-    def test_validate_edge_cases(self):
+    def test_validate_edge_cases(self, validation_handler):
         """Test edge cases in validation."""
-        # Empty extension
-        result = validate(
-            street_name="SMALLEPAD",
-            house_number=30,
-            house_number_extension="",
-            postcode="3811 MG",
-            city="AMERSFOORT"
-        )
-        assert result is True
-
-        # Lowercase city name
-        result = validate(
-            street_name="SMALLEPAD",
-            house_number=30,
-            house_number_extension="",
-            postcode="3811 MG",
-            city="amersfoort"
+        cases = [
+            ("SMALLEPAD", "AMERSFOORT"),  # Empty extension
+            ("SMALLEPAD", "amersfoort"),  # Lowercase city name
+            ("Smallepad", "AMERSFOORT"),  # Mixed case street name
+        ]
+
+        results = tuple(validation_handler.validate(street_name=street, house_number=30,
+                                                    house_number_extension="",
+                                                    postcode="3811 MG", city=city)
+                        for street, city in cases)
+        assert results == (True, True, True)
+
+    def test_validate_components(self, validation_handler):
+        """Test component validation returns the normalized address dict."""
+        is_valid, normalized = validation_handler.validator.validate_components(
+            "SMALLEPAD", 30, "e", "3811mg", "AMERSFOORT"
         )
-        assert result is True
+        assert is_valid is True
+        assert normalized == Address("SMALLEPAD", 30, "e", "3811mg", "AMERSFOORT").to_dict()
 
-        # Mixed case street name
-        result = validate(
-            street_name="Smallepad",
-            house_number=30,
-            house_number_extension="",
-            postcode="3811 MG",
-            city="AMERSFOORT"
+        is_valid, normalized = validation_handler.validator.validate_components(
+            "SMALLEPAD", 999, "", "3811 MG", "AMERSFOORT"
         )
-        assert result is True
\ No newline at end of file
+        assert is_valid is False
+        assert normalized is None